@@ -7,6 +7,7 @@
 #include "fairseq2n/data/immutable_string.h"
 
 #include <algorithm>
+#include <cstring>
 
 #include "fairseq2n/data/text/detail/utf.h"
 #include "fairseq2n/detail/exception.h"
@@ -60,17 +61,28 @@ immutable_string::split(
 {
     std::string_view s = view();
 
+    const char *begin = s.data();
+    const char *end = begin + s.size();
+
     std::size_t offset = 0;
 
-    for (std::size_t char_idx = 0; char_idx < s.size(); ++char_idx) {
-        if (s[char_idx] == separator) {
-            immutable_string part{storage_.share_slice(offset, char_idx - offset)};
+    // `memchr` is vectorized by the C library (e.g. SSE2/AVX2 in glibc with
+    // runtime dispatch), so we use it to scan for the separator instead of
+    // comparing one character at a time.
+    for (const char *ptr = begin; ptr != end; ++ptr) {
+        ptr = static_cast<const char *>(
+            std::memchr(ptr, separator, static_cast<std::size_t>(end - ptr)));
+        if (ptr == nullptr)
+            break;
+
+        auto char_idx = static_cast<std::size_t>(ptr - begin);
+
+        immutable_string part{storage_.share_slice(offset, char_idx - offset)};
 
-            if (!handler(std::move(part)))
-                return;
+        if (!handler(std::move(part)))
+            return;
 
-            offset = char_idx + 1;
-        }
+        offset = char_idx + 1;
     }
 
     handler(remove_prefix(offset));
@@ -37,28 +37,53 @@ string_splitter::string_splitter(
 data
 string_splitter::operator()(data &&d) const
 {
-    if (!d.is_string())
-        throw_<std::invalid_argument>(
-            "The input data must be of type `string`, but is of type `{}` instead.", d.type());
+    if (d.is_string())
+        return split(d.as_string());
+
+    // Split a batch of strings in a single call.
+    if (d.is_list()) {
+        const data_list &batch = d.as_list();
+
+        data_list output{};
+
+        output.reserve(batch.size());
+
+        for (const data &element : batch) {
+            if (!element.is_string())
+                throw_<std::invalid_argument>(
+                    "The elements of the input list must be of type `string`, but an element is of type `{}` instead.", element.type());
+
+            output.push_back(split(element.as_string()));
+        }
+
+        return output;
+    }
+
+    throw_<std::invalid_argument>(
+        "The input data must be of type `string` or `list`, but is of type `{}` instead.", d.type());
+}
 
+data
+string_splitter::split(const immutable_string &s) const
+{
     data_list fields{};
 
     auto idx_pos = indices_.begin();
 
     std::size_t idx = 0;
 
-    d.as_string().split(separator_, [this, &fields, &idx_pos, &idx](immutable_string &&s) {
+    s.split(separator_, [this, &fields, &idx_pos, &idx](immutable_string &&field) {
         if (idx_pos == indices_.end()) {
-            fields.emplace_back(std::move(s));
+            fields.emplace_back(std::move(field));
         } else {
             if (exclude_) {
                 if (idx != *idx_pos)
-                    fields.emplace_back(std::move(s));
+                    fields.emplace_back(std::move(field));
                 else
                     ++idx_pos;
             } else {
                 if (idx == *idx_pos) {
-                    fields.emplace_back(std::move(s));
+                    fields.emplace_back(std::move(field));
 
                     // We got all fields we need, no need to process the rest.
                     if (++idx_pos == indices_.end())
@@ -13,6 +13,7 @@
 
 #include "fairseq2n/api.h"
 #include "fairseq2n/data/data.h"
+#include "fairseq2n/data/immutable_string.h"
 
 namespace fairseq2n {
 
@@ -28,6 +29,10 @@ public:
     data
     operator()(data &&d) const;
 
+private:
+    data
+    split(const immutable_string &s) const;
+
 private:
     char separator_;
     std::vector<std::string> names_;
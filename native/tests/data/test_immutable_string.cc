@@ -6,8 +6,11 @@
 
 #include <fairseq2n/data/immutable_string.h>
 
+#include <cstddef>
 #include <functional>
 #include <memory>
+#include <string>
+#include <vector>
 
 #include <gtest/gtest.h>
 
@@ -29,3 +32,47 @@ TEST(test_immutable_string, copy_constructor_works)
 
     EXPECT_EQ(s1.data(), s2.data());
 }
+
+TEST(test_immutable_string, split_works)
+{
+    immutable_string s = "23\t9\t12\t\tabc\t\t";
+
+    std::vector<immutable_string> parts = s.split('\t');
+
+    std::vector<immutable_string> expected = {"23", "9", "12", "", "abc", "", ""};
+
+    EXPECT_EQ(parts, expected);
+}
+
+TEST(test_immutable_string, split_works_when_string_spans_multiple_words)
+{
+    // Place separators around 8, 16, and 32 byte boundaries to exercise the
+    // word-wise and vector-wise scans of the underlying `memchr`.
+    std::string str(70, 'a');
+
+    for (std::size_t pos : {0U, 7U, 8U, 15U, 31U, 32U, 33U, 63U, 69U})
+        str[pos] = ',';
+
+    immutable_string s = str;
+
+    std::vector<immutable_string> parts = s.split(',');
+
+    std::vector<std::string> expected{};
+
+    std::size_t offset = 0;
+
+    for (std::size_t pos = 0; pos < str.size(); ++pos) {
+        if (str[pos] == ',') {
+            expected.push_back(str.substr(offset, pos - offset));
+
+            offset = pos + 1;
+        }
+    }
+
+    expected.push_back(str.substr(offset));
+
+    ASSERT_EQ(parts.size(), expected.size());
+
+    for (std::size_t i = 0; i < parts.size(); ++i)
+        EXPECT_EQ(parts[i].to_string(), expected[i]);
+}
@@ -4,7 +4,17 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
-from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Union, final
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    final,
+    overload,
+)
 
 from fairseq2n import DOC_MODE
 from torch import Tensor
@@ -36,6 +46,12 @@ if TYPE_CHECKING or DOC_MODE:
             # keep only the first and second column and convert to dict: {"en": "Go.", "fr": "Va !"}
             dataloader = read_text("tatoeba.tsv").map(StrSplitter(names=["en", "fr"], indices=[0, 1])).and_return()
 
+        .. note::
+            The split fields are zero-copy slices of the input string. When
+            passed to :meth:`DataPipelineBuilder.map`, the splitter runs
+            natively and the fields are only materialized as Python strings
+            once they are returned from the pipeline; downstream native ops
+            such as :class:`StrToTensorConverter` read them in place.
         """
 
         def __init__(
@@ -47,9 +63,21 @@ if TYPE_CHECKING or DOC_MODE:
         ) -> None:
             ...
 
+        @overload
         def __call__(self, s: str) -> Union[List[str], Dict[str, str]]:
             ...
 
+        @overload
+        def __call__(self, s: List[str]) -> List[Union[List[str], Dict[str, str]]]:
+            ...
+
+        def __call__(self, s: Union[str, List[str]]) -> Any:
+            """
+            :param s:
+                The string to split. If a list of strings is passed, all strings
+                are split in a single native call with the GIL released.
+            """
+
     @final
     class StrToIntConverter:
         """Parses integers in a given base"""
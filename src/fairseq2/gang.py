@@ -6,19 +6,19 @@
 
 from __future__ import annotations
 
-import logging
 import os
 from abc import ABC, abstractmethod
 from datetime import timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional, Sequence, final
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, final
 
 import torch
 import torch.distributed as dist
 from torch import Tensor
 from torch.distributed import Backend, ProcessGroup, ReduceOp
 
-from fairseq2.typing import CPU, Device, override
+from fairseq2.typing import CPU, DataType, Device, override
 from fairseq2.utils.logging import get_log_writer
 from fairseq2.utils.version import torch_greater_or_equal
 
@@ -38,6 +38,15 @@ class ReduceOperation(Enum):
 class Gang(ABC):
     """Represents a set of processes that work collectively."""
 
+    rank: int
+    """The rank of this process in the gang."""
+
+    size: int
+    """The number of processes that are part of the gang."""
+
+    device: Device
+    """The associated device."""
+
     @abstractmethod
     def close(self) -> None:
         """Close and destroy the gang."""
@@ -68,10 +77,51 @@ class Gang(ABC):
             The element-wise reduce operation.
         """
 
+    @abstractmethod
+    def all_reduce_coalesced(self, tensors: List[Tensor], op: ReduceOperation) -> None:
+        """Reduce ``tensors`` across all processes with as few collective calls
+        as possible.
+
+        The cost of a collective call can be modeled as ``α + βN`` where ``α``
+        is a fixed latency and ``N`` is the message size. For small tensors
+        ``α`` dominates, so reducing them together is considerably faster than
+        calling :meth:`all_reduce` on each of them.
+
+        :param tensors:
+            The input and output tensors of the operation.
+        :param op:
+            The element-wise reduce operation.
+        """
+
+    @abstractmethod
+    def reduce_scatter(
+        self, output_tensor: Tensor, input_tensor: Tensor, op: ReduceOperation
+    ) -> None:
+        """Reduce ``input_tensor`` across all processes and scatter the result.
+
+        ``input_tensor`` is split into :attr:`size` equal chunks along its first
+        dimension, and this process receives the reduction of the chunk at
+        index :attr:`rank` in ``output_tensor``.
+
+        Note that an all-reduce is equivalent to a reduce-scatter followed by an
+        all-gather. Callers that only need their own shard of the reduced data
+        can skip the all-gather and halve the amount of data transferred.
+
+        :param output_tensor:
+            The output tensor to accomodate the reduced chunk of this process.
+        :param input_tensor:
+            The tensor to be reduced and scattered.
+        :param op:
+            The element-wise reduce operation.
+        """
+
     @abstractmethod
     def all_gather(self, output_tensor: Tensor, input_tensor: Tensor) -> None:
         """Gather tensors from all processes and put them in ``output_tensor``.
 
+        Prefer this method over :meth:`all_gather_to_list` when possible as it
+        gathers directly into a single contiguous tensor.
+
         :param output_tensor:
             The output tensor to accomodate tensors from all processes.
         :param input_tensor:
@@ -101,29 +151,25 @@ class Gang(ABC):
             The rank of the process from which to broadcast ``objects``.
         """
 
-    @property
     @abstractmethod
-    def rank(self) -> int:
-        """The rank of this process in the gang."""
+    def broadcast_tensors(self, tensors: List[Tensor], source_rank: int = 0) -> None:
+        """Broadcast ``tensors`` from ``source_rank`` in-place.
 
-    @property
-    @abstractmethod
-    def size(self) -> int:
-        """The number of processes that are part of the gang."""
+        Unlike :meth:`broadcast_objects`, this method does not pickle its input
+        and should be preferred when the values to broadcast are tensors with
+        shapes known by all processes.
 
-    @property
-    @abstractmethod
-    def device(self) -> Device:
-        """The associated device."""
+        :param tensors:
+            The tensors to broadcast. Each process must provide tensors of equal
+            number, shape, and data type.
+        :param source_rank:
+            The rank of the process from which to broadcast ``tensors``.
+        """
 
 
 class AbstractGang(Gang):
     """Provides a skeletal implementation of :class:`Gang`."""
 
-    _rank: int
-    _size: int
-    _device: Device
-
     def __init__(self, rank: int, size: int, device: Device) -> None:
         """
         :param rank:
@@ -133,23 +179,27 @@ class AbstractGang(Gang):
         :param device:
             The associated device.
         """
-        self._rank = rank
-        self._size = size
+        self.rank = rank
+        self.size = size
 
-        self._device = device
+        self.device = device
 
     @final
     @override
     def create_gang(self, ranks: Sequence[int]) -> Gang:
-        if len(set(ranks)) != len(ranks):
-            raise ValueError("The ranks in ``ranks`` must be all unique.")
+        seen = bytearray(self.size)
 
         for idx, rank in enumerate(ranks):
-            if rank < 0 or rank > self._size:
+            if rank < 0 or rank >= self.size:
                 raise ValueError(
-                    f"The rank at index {idx} in ``ranks`` must be greater than or equal to 0 and less than the size of the gang ({self._size}), but is {rank} instead."
+                    f"The rank at index {idx} in ``ranks`` must be greater than or equal to 0 and less than the size of the gang ({self.size}), but is {rank} instead."
                 )
 
+            if seen[rank]:
+                raise ValueError("The ranks in ``ranks`` must be all unique.")
+
+            seen[rank] = 1
+
         return self._do_create_gang(ranks)
 
     @abstractmethod
@@ -160,24 +210,6 @@ class AbstractGang(Gang):
             The ranks of processes that will be part of the new gang.
         """
 
-    @final
-    @property
-    @override
-    def rank(self) -> int:
-        return self._rank
-
-    @final
-    @property
-    @override
-    def size(self) -> int:
-        return self._size
-
-    @final
-    @property
-    @override
-    def device(self) -> Device:
-        return self._device
-
 
 @final
 class FakeGang(AbstractGang):
@@ -214,8 +246,26 @@ class FakeGang(AbstractGang):
     def all_reduce(self, tensor: Tensor, op: ReduceOperation) -> None:
         pass
 
+    @override
+    def all_reduce_coalesced(self, tensors: List[Tensor], op: ReduceOperation) -> None:
+        pass
+
+    @override
+    def reduce_scatter(
+        self, output_tensor: Tensor, input_tensor: Tensor, op: ReduceOperation
+    ) -> None:
+        output_tensor.copy_(input_tensor)
+
     @override
     def all_gather(self, output_tensor: Tensor, input_tensor: Tensor) -> None:
+        # Skip the copy if the tensors are views of the same memory.
+        if (
+            output_tensor.data_ptr() == input_tensor.data_ptr()
+            and output_tensor.stride() == input_tensor.stride()
+            and output_tensor.shape == input_tensor.shape
+        ):
+            return
+
         output_tensor.copy_(input_tensor)
 
     @override
@@ -223,11 +273,17 @@ class FakeGang(AbstractGang):
         if source_rank != 0:
             raise ValueError(f"`source_rank` must be 0, but is {source_rank} instead.")
 
+    @override
+    def broadcast_tensors(self, tensors: List[Tensor], source_rank: int = 0) -> None:
+        if source_rank != 0:
+            raise ValueError(f"`source_rank` must be 0, but is {source_rank} instead.")
+
     @override
     def all_gather_to_list(
         self, output_tensors: List[Tensor], input_tensor: Tensor
     ) -> None:
-        output_tensors[0] = input_tensor.clone().detach()
+        # Note that, unlike in a real gang, the output aliases the input.
+        output_tensors[0] = input_tensor.detach()
 
 
 @final
@@ -235,7 +291,11 @@ class ProcessGroupGang(AbstractGang):
     """Represents a gang that wraps a process group."""
 
     _pg: ProcessGroup
+    _backend: Optional[str]
     _debug_pg: Optional[ProcessGroup]
+    _barrier_device_ids: Optional[List[int]]
+    _barrier: Callable[[], None]
+    _maybe_monitored_barrier: Callable[[], None]
 
     def __init__(
         self, pg: ProcessGroup, device: Device, debug_pg: Optional[ProcessGroup] = None
@@ -243,8 +303,29 @@ class ProcessGroupGang(AbstractGang):
         super().__init__(dist.get_rank(pg), dist.get_world_size(pg), device)
 
         self._pg = pg
+
+        # A process that is not part of `pg` cannot query its backend.
+        self._backend = None if self.rank == -1 else dist.get_backend(pg)
+
         self._debug_pg = debug_pg
 
+        # `device_ids` is only meaningful for NCCL barriers.
+        if device.type == "cuda" and device.index is not None:
+            self._barrier_device_ids = [device.index]
+        else:
+            self._barrier_device_ids = None
+
+        # Resolve the barriers once, so that the non-debug path does not pay
+        # for a check on every call.
+        if debug_pg is None:
+            self._barrier = self._process_group_barrier
+
+            self._maybe_monitored_barrier = _no_op
+        else:
+            self._barrier = self._monitored_barrier
+
+            self._maybe_monitored_barrier = self._monitored_barrier
+
     @staticmethod
     def init_default_process_group(
         *,
@@ -314,18 +395,12 @@ class ProcessGroupGang(AbstractGang):
             )
 
         if device.type == "cuda":
-            nccl_env_name = "NCCL_ASYNC_ERROR_HANDLING"
-
-            if torch_greater_or_equal(2, 2):
-                try:
-                    del os.environ[nccl_env_name]  # Suppress the deprecation warning.
-                except KeyError:
-                    pass
-
-                nccl_env_name = "TORCH_NCCL_ASYNC_ERROR_HANDLING"
+            if _DEPRECATED_NCCL_ASYNC_ERROR_ENV is not None:
+                # Suppress the deprecation warning.
+                os.environ.pop(_DEPRECATED_NCCL_ASYNC_ERROR_ENV, None)
 
             # See https://github.com/pytorch/pytorch/issues/46874.
-            os.environ[nccl_env_name] = "1"
+            os.environ[_NCCL_ASYNC_ERROR_ENV] = "1"
 
         if timeout is None:
             timeout = timedelta(minutes=15)
@@ -398,8 +473,11 @@ class ProcessGroupGang(AbstractGang):
                 "`create_gang()` can only be called on the gang associated with the default (i.e. main) process group."
             )
 
-        backend = dist.get_backend()
+        backend = self._backend
 
+        # Note that `dist.new_subgroups_by_enumeration()` offers no advantage
+        # over creating sibling groups one by one, as it calls `new_group()`
+        # for each subgroup internally.
         pg = dist.new_group(ranks, backend=backend)
 
         if self._debug_pg is not None:
@@ -410,7 +488,7 @@ class ProcessGroupGang(AbstractGang):
         else:
             debug_pg = None
 
-        return ProcessGroupGang(pg, self._device, debug_pg)
+        return ProcessGroupGang(pg, self.device, debug_pg)
 
     @override
     def as_process_group(self) -> ProcessGroup:
@@ -418,12 +496,7 @@ class ProcessGroupGang(AbstractGang):
 
     @override
     def barrier(self) -> None:
-        if self._debug_pg is None:
-            dist.barrier(group=self._pg, device_ids=[self._device.index])
-        else:
-            torch.cuda.synchronize()
-
-            dist.monitored_barrier(group=self._debug_pg, wait_all_ranks=True)
+        self._barrier()
 
     @override
     def all_reduce(self, tensor: Tensor, op: ReduceOperation) -> None:
@@ -431,6 +504,54 @@ class ProcessGroupGang(AbstractGang):
 
         dist.all_reduce(tensor, self._get_reduce_op(op), group=self._pg)
 
+    @override
+    def all_reduce_coalesced(self, tensors: List[Tensor], op: ReduceOperation) -> None:
+        self._maybe_monitored_barrier()
+
+        reduce_op = self._get_reduce_op(op)
+
+        # Tensors can only be flattened into a single buffer if they share the
+        # same data type and device.
+        buckets: Dict[Tuple[DataType, Device], List[Tensor]] = {}
+
+        for tensor in tensors:
+            buckets.setdefault((tensor.dtype, tensor.device), []).append(tensor)
+
+        # Like `all_reduce`, the flattening and copying back must not be
+        # recorded by autograd; otherwise, the in-place copy fails for leaf
+        # tensors that require grad.
+        with torch.no_grad():
+            for bucket in buckets.values():
+                if len(bucket) == 1:
+                    dist.all_reduce(bucket[0], reduce_op, group=self._pg)
+
+                    continue
+
+                flat_tensor = torch.cat([t.reshape(-1) for t in bucket])
+
+                dist.all_reduce(flat_tensor, reduce_op, group=self._pg)
+
+                offset = 0
+
+                for tensor in bucket:
+                    numel = tensor.numel()
+
+                    flat_view = flat_tensor[offset : offset + numel]
+
+                    tensor.copy_(flat_view.view_as(tensor))
+
+                    offset += numel
+
+    @override
+    def reduce_scatter(
+        self, output_tensor: Tensor, input_tensor: Tensor, op: ReduceOperation
+    ) -> None:
+        self._maybe_monitored_barrier()
+
+        dist.reduce_scatter_tensor(
+            output_tensor, input_tensor, self._get_reduce_op(op), group=self._pg
+        )
+
     @override
     def all_gather(self, output_tensor: Tensor, input_tensor: Tensor) -> None:
         self._maybe_monitored_barrier()
@@ -443,7 +564,19 @@ class ProcessGroupGang(AbstractGang):
     ) -> None:
         self._maybe_monitored_barrier()
 
-        dist.all_gather(output_tensors, input_tensor, group=self._pg)
+        # If `output_tensors` are consecutive views of a single buffer, we can
+        # gather directly into that buffer and avoid the per-rank copies of
+        # `all_gather`. Only NCCL supports `all_gather_into_tensor` across all
+        # PyTorch versions we build against.
+        if self._backend == Backend.NCCL:
+            output_tensor = self._maybe_as_flat_tensor(output_tensors, input_tensor)
+        else:
+            output_tensor = None
+
+        if output_tensor is not None:
+            dist.all_gather_into_tensor(output_tensor, input_tensor, group=self._pg)
+        else:
+            dist.all_gather(output_tensors, input_tensor, group=self._pg)
 
     @override
     def broadcast_objects(self, objects: List[Any], source_rank: int = 0) -> None:
@@ -451,44 +584,113 @@ class ProcessGroupGang(AbstractGang):
 
         dist.broadcast_object_list(objects, source_rank)
 
-    def _maybe_monitored_barrier(self) -> None:
-        if self._debug_pg is None:
-            return
+    @override
+    def broadcast_tensors(self, tensors: List[Tensor], source_rank: int = 0) -> None:
+        self._maybe_monitored_barrier()
+
+        if self._pg is dist.group.WORLD:
+            global_source_rank = source_rank
+        else:
+            global_source_rank = dist.get_global_rank(self._pg, source_rank)
+
+        for tensor in tensors:
+            dist.broadcast(tensor, global_source_rank, group=self._pg)
+
+    def _maybe_as_flat_tensor(
+        self, output_tensors: List[Tensor], input_tensor: Tensor
+    ) -> Optional[Tensor]:
+        if len(output_tensors) != self.size or not input_tensor.is_contiguous():
+            return None
+
+        numel = input_tensor.numel()
+
+        first_tensor = output_tensors[0]
+
+        storage_ptr = first_tensor.untyped_storage().data_ptr()
+
+        data_ptr = first_tensor.data_ptr()
+
+        stride = numel * first_tensor.element_size()
+
+        for idx, tensor in enumerate(output_tensors):
+            if tensor.dtype != input_tensor.dtype:
+                return None
+
+            if tensor.device != input_tensor.device:
+                return None
+
+            if tensor.shape != input_tensor.shape or not tensor.is_contiguous():
+                return None
+
+            if tensor.untyped_storage().data_ptr() != storage_ptr:
+                return None
 
-        torch.cuda.synchronize()
+            if tensor.data_ptr() != data_ptr + idx * stride:
+                return None
+
+        return first_tensor.as_strided((self.size * numel,), (1,))
+
+    def _process_group_barrier(self) -> None:
+        dist.barrier(group=self._pg, device_ids=self._barrier_device_ids)
+
+    def _monitored_barrier(self) -> None:
+        # Wait only for the work queued on the current stream instead of
+        # synchronizing all streams of the device.
+        if self.device.type == "cuda":
+            torch.cuda.current_stream(self.device).synchronize()
 
         dist.monitored_barrier(group=self._debug_pg, wait_all_ranks=True)
 
     @staticmethod
     def _get_reduce_op(op: ReduceOperation):  # type: ignore[no-untyped-def]
-        if op == ReduceOperation.SUM:
-            return ReduceOp.SUM
-        if op == ReduceOperation.MEAN:
-            return ReduceOp.AVG  # type: ignore[attr-defined]
-        if op == ReduceOperation.PRODUCT:
-            return ReduceOp.PRODUCT
-        if op == ReduceOperation.MIN:
-            return ReduceOp.MIN
-        if op == ReduceOperation.MAX:
-            return ReduceOp.MAX
+        try:
+            return _REDUCE_OP_MAP[op]
+        except KeyError:
+            raise ValueError(
+                f"`op` must be an operation supported by the underlying process group, but is `{op}` instead."
+            ) from None
+
+
+_REDUCE_OP_MAP: Dict[ReduceOperation, Any] = {
+    ReduceOperation.SUM: ReduceOp.SUM,
+    ReduceOperation.MEAN: ReduceOp.AVG,  # type: ignore[attr-defined]
+    ReduceOperation.PRODUCT: ReduceOp.PRODUCT,
+    ReduceOperation.MIN: ReduceOp.MIN,
+    ReduceOperation.MAX: ReduceOp.MAX,
+}
 
-        raise ValueError(
-            f"`op` must be an operation supported by the underlying process group, but is `{op}` instead."
-        )
 
+if torch_greater_or_equal(2, 2):
+    _NCCL_ASYNC_ERROR_ENV = "TORCH_NCCL_ASYNC_ERROR_HANDLING"
 
+    _DEPRECATED_NCCL_ASYNC_ERROR_ENV: Optional[str] = "NCCL_ASYNC_ERROR_HANDLING"
+else:
+    _NCCL_ASYNC_ERROR_ENV = "NCCL_ASYNC_ERROR_HANDLING"
+
+    _DEPRECATED_NCCL_ASYNC_ERROR_ENV = None
+
+
+def _no_op() -> None:
+    pass
+
+
+@lru_cache(maxsize=None)
 def _get_num_cpus(num_procs: int) -> int:
     num_cpus = os.cpu_count()
 
-    affinity_mask = os.sched_getaffinity(0)
-
-    if num_cpus is None or affinity_mask is None:
+    if num_cpus is None:
         log.warning("The number of CPUs cannot be determined.")
 
         return 1
 
+    num_cpus = max(num_cpus // num_procs, 1)
+
+    # `sched_getaffinity()` is only available on some Unix platforms.
+    if not hasattr(os, "sched_getaffinity"):
+        return num_cpus
+
     # We should not exceed the number of cores available in the affinity mask.
-    return min(max(num_cpus // num_procs, 1), len(affinity_mask))
+    return min(num_cpus, len(os.sched_getaffinity(0)))
 
 
 _default_device: Optional[Device] = None
@@ -510,7 +712,7 @@ def _determine_default_device() -> Device:
             ) from ex
 
     if _default_device is None:
-        if torch.cuda.is_available() and torch.cuda.device_count() > 0:
+        if _get_num_cuda_devices() > 0:
             _default_device = _determine_default_cuda_device()
 
     if _default_device is None:
@@ -539,7 +741,7 @@ def _determine_default_cuda_device() -> Device:
         device = None
 
     if device is None:
-        num_devices = torch.cuda.device_count()
+        num_devices = _get_num_cuda_devices()
 
         idx = _get_device_index(num_devices, device_type="cuda")
 
@@ -548,6 +750,13 @@ def _determine_default_cuda_device() -> Device:
     return device
 
 
+def _get_num_cuda_devices() -> int:
+    if not torch.cuda.is_available():
+        return 0
+
+    return torch.cuda.device_count()
+
+
 def _get_device_index(num_devices: int, device_type: str) -> int:
     assert num_devices > 0
 
@@ -576,29 +785,49 @@ def _get_device_index(num_devices: int, device_type: str) -> int:
     return device_idx
 
 
+@lru_cache(maxsize=1)
 def get_world_size() -> int:
-    """Return the world size of the running job."""
+    """Return the world size of the running job.
+
+    The value is read from the ``WORLD_SIZE`` environment variable on the first
+    call and cached; later changes to the environment are not reflected.
+    """
     value = _get_int_from_env("WORLD_SIZE")
 
     return 1 if value is None else value
 
 
+@lru_cache(maxsize=1)
 def get_rank() -> int:
-    """Return the rank of this process in the running job."""
+    """Return the rank of this process in the running job.
+
+    The value is read from the ``RANK`` environment variable on the first
+    call and cached; later changes to the environment are not reflected.
+    """
     value = _get_int_from_env("RANK", allow_zero=True)
 
     return 0 if value is None else value
 
 
+@lru_cache(maxsize=1)
 def get_local_world_size() -> int:
-    """Return the local world size of the running job."""
+    """Return the local world size of the running job.
+
+    The value is read from the ``LOCAL_WORLD_SIZE`` environment variable on the first
+    call and cached; later changes to the environment are not reflected.
+    """
     value = _get_int_from_env("LOCAL_WORLD_SIZE")
 
     return 1 if value is None else value
 
 
+@lru_cache(maxsize=1)
 def get_local_rank() -> int:
-    """Return the local rank of this process in the running job."""
+    """Return the local rank of this process in the running job.
+
+    The value is read from the ``LOCAL_RANK`` environment variable on the first
+    call and cached; later changes to the environment are not reflected.
+    """
     value = _get_int_from_env("LOCAL_RANK", allow_zero=True)
 
     return 0 if value is None else value
@@ -613,8 +842,8 @@ def _get_int_from_env(var_name: str, allow_zero: bool = False) -> Optional[int]:
         value = int(s)
     except ValueError:
         raise RuntimeError(
-            f"The value of the `{var_name}` environment variable must be an integer, but is '{value}' instead."
-        )
+            f"The value of the `{var_name}` environment variable must be an integer, but is '{s}' instead."
+        ) from None
 
     if not allow_zero:
         if not value >= 1:
@@ -671,6 +900,10 @@ def setup_parallel_gangs(root_gang: Gang, *, tp_size: int = 1) -> Dict[str, Gang
     host. For example, if there are two hosts with a total of 16 GPUs, ranks 0
     to 7 belong to the first host and ranks 8 to 15 belong to the second host.
 
+    Note that this is a collective operation and must be called by all processes
+    in ``root_gang``. Each process takes part in the creation of all sub-gangs,
+    including the ones it is not a member of.
+
     :param root_gang:
         The gang whose topology will be used to create the new gangs.
     :param tp_size:
@@ -686,26 +919,26 @@ def setup_parallel_gangs(root_gang: Gang, *, tp_size: int = 1) -> Dict[str, Gang
 
     if root_gang.size % tp_size != 0:
         raise ValueError(
-            f"`tp_size` must be divisible by `root_gang.size` ({root_gang.size}), but is {tp_size} instead."
+            f"`root_gang.size` ({root_gang.size}) must be divisible by `tp_size`, but `tp_size` is {tp_size} instead."
         )
 
     dp_size = root_gang.size // tp_size
 
-    if log.is_enabled_for(logging.INFO):
-        for name, size in [("data", dp_size), ("tensor", tp_size)]:
-            if size == 1:
-                continue
+    if dp_size > 1:
+        log.info("Initializing data parallelism with a gang of size {}.", dp_size)
 
-            log.info("Initializing {} parallelism with a gang of size {}.", name, size)
+    if tp_size > 1:
+        log.info("Initializing tensor parallelism with a gang of size {}.", tp_size)
 
-    mesh = torch.arange(root_gang.size).view(dp_size, tp_size)
-
-    # Get the coordinate of this process in the mesh.
-    rank_coords = [x.item() for x in torch.where(mesh == root_gang.rank)]
+    # Get the coordinate of this process in the (dp_size, tp_size) mesh.
+    dp_rank, tp_rank = divmod(root_gang.rank, tp_size)
 
     dp_gang: Optional[Gang] = None
     tp_gang: Optional[Gang] = None
 
+    # Note that we have to create all sub-gangs, even the ones this process is
+    # not part of, since gang creation is a collective operation.
+
     # Build the gangs for data parallelism.
     if dp_size == 1:
         dp_gang = FakeGang(root_gang.device)
@@ -713,8 +946,10 @@ def setup_parallel_gangs(root_gang: Gang, *, tp_size: int = 1) -> Dict[str, Gang
         dp_gang = root_gang
     else:
         for i in range(tp_size):
-            sub_gang = root_gang.create_gang(mesh[:, i].tolist())
-            if i == rank_coords[1]:
+            ranks = list(range(i, root_gang.size, tp_size))
+
+            sub_gang = root_gang.create_gang(ranks)
+            if i == tp_rank:
                 dp_gang = sub_gang
 
     # Build the gangs for tensor parallelism.
@@ -724,8 +959,10 @@ def setup_parallel_gangs(root_gang: Gang, *, tp_size: int = 1) -> Dict[str, Gang
         tp_gang = root_gang
     else:
         for i in range(dp_size):
-            sub_gang = root_gang.create_gang(mesh[i, :].tolist())
-            if i == rank_coords[0]:
+            ranks = list(range(i * tp_size, (i + 1) * tp_size))
+
+            sub_gang = root_gang.create_gang(ranks)
+            if i == dp_rank:
                 tp_gang = sub_gang
 
     assert dp_gang is not None
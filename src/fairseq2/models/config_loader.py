@@ -16,7 +16,7 @@ from fairseq2.assets import (
 )
 from fairseq2.config_registry import ConfigRegistry
 from fairseq2.typing import DataClass
-from fairseq2.utils.dataclass import update_dataclass
+from fairseq2.utils.dataclass import _copy_dataclass, update_dataclass
 
 ModelConfigT = TypeVar("ModelConfigT", bound=DataClass)
 
@@ -72,11 +72,18 @@ class StandardModelConfigLoader(ModelConfigLoader[ModelConfigT]):
 
         card.field("model_family").check_equals(self._family)
 
+        config_field = card.field("model_config")
+
+        has_config_field = True
+
         # If the card holds a configuration object, it takes precedence.
         try:
-            config = card.field("model_config").as_(self._config_kls)
+            config = config_field.as_(self._config_kls)
 
-            return deepcopy(config)
+            return _copy_dataclass(config)
+        except AssetCardFieldNotFoundError:
+            # No need to check for configuration overrides below.
+            has_config_field = False
         except AssetCardError:
             pass
 
@@ -109,7 +116,9 @@ class StandardModelConfigLoader(ModelConfigLoader[ModelConfigT]):
 
         # Check if we should override anything in the default model
         # configuration.
-        if config_overrides := card.field("model_config").get_as_(dict):
+        if has_config_field and (config_overrides := config_field.get_as_(dict)):
+            # `update_dataclass` consumes `config_overrides` and stores its
+            # values in `config`; copy it to keep the card intact.
             try:
                 update_dataclass(config, deepcopy(config_overrides))
             except (TypeError, ValueError) as ex:
@@ -4,7 +4,8 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
-from typing import Any, Dict, final
+from functools import lru_cache
+from typing import Any, Dict, Final, Mapping, final
 
 from fairseq2.assets import AssetCard, default_asset_store, default_download_manager
 from fairseq2.data.text import default_basic_sentencepiece_tokenizer_loader
@@ -21,7 +22,6 @@ from fairseq2.models.transformer import (
     TransformerDecoderModel,
     shard_transformer_decoder_model,
 )
-from fairseq2.models.utils.checkpoint import convert_model_state_dict
 from fairseq2.typing import override
 
 load_llama_config = StandardModelConfigLoader(
@@ -47,36 +47,116 @@ class LLaMAModelLoader(DenseModelLoader[TransformerDecoderModel, LLaMAConfig]):
 def convert_llama_checkpoint(
     checkpoint: Dict[str, Any], config: LLaMAConfig
 ) -> Dict[str, Any]:
-    """Convert a reference LLaMA checkpoint to fairseq2 format."""
+    """Convert a reference LLaMA checkpoint to fairseq2 format.
+
+    The keys of ``checkpoint`` are renamed in place, and the returned
+    checkpoint wraps the same dictionary. Pass a copy if the original
+    checkpoint is still needed.
+    """
     # Check if we have a fairseq2 checkpoint.
     if "model" in checkpoint:
         return checkpoint
 
-    key_map = {
-        # fmt: off
-        r"^layers\.([0-9]+)\.attention\.wq\.":    r"decoder.layers.\1.self_attn.q_proj.",
-        r"^layers\.([0-9]+)\.attention\.wk\.":    r"decoder.layers.\1.self_attn.k_proj.",
-        r"^layers\.([0-9]+)\.attention\.wv\.":    r"decoder.layers.\1.self_attn.v_proj.",
-        r"^layers\.([0-9]+)\.attention\.wo\.":    r"decoder.layers.\1.self_attn.output_proj.",
-        r"^layers\.([0-9]+)\.attention_norm\.":   r"decoder.layers.\1.self_attn_layer_norm.",
-        r"^layers\.([0-9]+)\.feed_forward\.w1\.": r"decoder.layers.\1.ffn.gate_proj.",
-        r"^layers\.([0-9]+)\.feed_forward\.w2\.": r"decoder.layers.\1.ffn.output_proj.",
-        r"^layers\.([0-9]+)\.feed_forward\.w3\.": r"decoder.layers.\1.ffn.inner_proj.",
-        r"^layers\.([0-9]+)\.ffn_norm\.":         r"decoder.layers.\1.ffn_layer_norm.",
-        r"^norm\.":                               r"decoder.layer_norm.",
-        r"^tok_embeddings\.":                     r"decoder_frontend.embed.",
-        r"^output\.":                             r"final_proj.",
-        # fmt: on
-    }
-
-    # We do not need the pre-computed 'rope.freqs' buffers.
-    checkpoint = {k: v for (k, v) in checkpoint.items() if "rope.freqs" not in k}
-
-    checkpoint = convert_model_state_dict(checkpoint, key_map)
+    # Rename the keys in place instead of building a second dictionary. None
+    # of the converted keys can collide with a reference key.
+    key_map = _get_llama_key_map(config.num_layers)
+
+    for key in list(checkpoint.keys()):
+        # We do not need the pre-computed 'rope.freqs' buffers.
+        if "rope.freqs" in key:
+            del checkpoint[key]
+
+            continue
+
+        module_name, _, param_name = key.rpartition(".")
+
+        new_module_name = key_map.get(module_name)
+        if new_module_name is not None:
+            new_key = f"{new_module_name}.{param_name}"
+        else:
+            new_key = _convert_llama_key(key)
+
+        if new_key != key:
+            checkpoint[new_key] = checkpoint.pop(key)
 
     return {"model": checkpoint}
 
 
+@lru_cache(maxsize=8)
+def _get_llama_key_map(num_layers: int) -> Mapping[str, str]:
+    # Expand the rename rules into a flat map of module names for the given
+    # number of layers so that most keys are converted with a single lookup.
+    key_map = dict(_LLAMA_KEY_MAP)
+
+    for idx in range(num_layers):
+        for component, new_component in _LLAMA_LAYER_KEY_MAP.items():
+            key_map[f"layers.{idx}.{component}"] = (
+                f"decoder.layers.{idx}.{new_component}"
+            )
+
+    return key_map
+
+
+def _convert_llama_key(key: str) -> str:
+    # All reference keys that we rename start with a fixed component followed
+    # by a dot, so we dispatch on the components instead of scanning the key
+    # with a regex for each rename rule.
+    head, dot, tail = key.partition(".")
+    if not dot:
+        return key
+
+    if head != "layers":
+        try:
+            return f"{_LLAMA_KEY_MAP[head]}.{tail}"
+        except KeyError:
+            return key
+
+    # layers.<idx>.<component>.<suffix> or layers.<idx>.<module>.<component>.<suffix>
+    idx, dot, tail = tail.partition(".")
+    # Only accept ASCII digits; `isdigit` alone also accepts other scripts.
+    if not dot or not (idx.isascii() and idx.isdigit()):
+        return key
+
+    component, dot, suffix = tail.partition(".")
+    if not dot:
+        return key
+
+    new_component = _LLAMA_LAYER_KEY_MAP.get(component)
+    if new_component is None:
+        subcomponent, dot, suffix = suffix.partition(".")
+        if not dot:
+            return key
+
+        new_component = _LLAMA_LAYER_KEY_MAP.get(f"{component}.{subcomponent}")
+        if new_component is None:
+            return key
+
+    return f"decoder.layers.{idx}.{new_component}.{suffix}"
+
+
+_LLAMA_KEY_MAP: Final = {
+    # fmt: off
+    "norm":           "decoder.layer_norm",
+    "tok_embeddings": "decoder_frontend.embed",
+    "output":         "final_proj",
+    # fmt: on
+}
+
+_LLAMA_LAYER_KEY_MAP: Final = {
+    # fmt: off
+    "attention.wq":    "self_attn.q_proj",
+    "attention.wk":    "self_attn.k_proj",
+    "attention.wv":    "self_attn.v_proj",
+    "attention.wo":    "self_attn.output_proj",
+    "attention_norm":  "self_attn_layer_norm",
+    "feed_forward.w1": "ffn.gate_proj",
+    "feed_forward.w2": "ffn.output_proj",
+    "feed_forward.w3": "ffn.inner_proj",
+    "ffn_norm":        "ffn_layer_norm",
+    # fmt: on
+}
+
+
 load_llama_model = LLaMAModelLoader(
     default_asset_store,
     default_download_manager,
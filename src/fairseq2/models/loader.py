@@ -230,7 +230,8 @@ class DenseModelLoader(ModelLoader[ModelT], Generic[ModelT, ModelConfigT]):
 
             return model
 
-        # Load the checkpoint.
+        # Load the checkpoint. If the checkpoint is sharded, each process reads
+        # only the shard that matches its rank in the tensor parallel gang.
         uri = card.field("checkpoint").as_uri()
 
         shard_idx = gang.rank if gang is not None and gang.size != 1 else None
@@ -103,6 +103,9 @@ def shard_transformer_decoder_model(
 ) -> None:
     """Shard ``model`` over ``gang``.
 
+    Sharding is a local operation; each process slices its own part of the
+    parameters based on its rank and no collective is issued over ``gang``.
+
     :param model:
         The model to shard.
     :param gang:
@@ -4,10 +4,11 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
+import os
 import re
 import warnings
 from pathlib import Path
-from typing import Any, Callable, Dict, Mapping, Optional, Protocol, Union
+from typing import Any, Callable, Dict, Final, Mapping, Optional, Protocol, Union
 from warnings import catch_warnings
 
 import torch
@@ -66,6 +67,11 @@ def load_checkpoint(
         if mmap and torch_greater_or_equal(2, 1):
             kwargs["mmap"] = True
 
+            # With memory mapping, the file is read lazily via page faults. Ask
+            # the kernel to start reading it ahead so that disk I/O overlaps
+            # with unpickling.
+            _prefetch_file(path)
+
         checkpoint: Dict[str, Any] = torch.load(
             str(path), map_location, weights_only=restrict, **kwargs
         )
@@ -76,6 +82,27 @@ def load_checkpoint(
     return checkpoint
 
 
+def _prefetch_file(path: Path) -> None:
+    # `POSIX_FADV_WILLNEED` makes the kernel start asynchronous readahead of
+    # the whole file and returns immediately, so disk reads overlap with the
+    # unpickling and key conversion that follow. On platforms without
+    # `posix_fadvise` we rely on page faults.
+    if not hasattr(os, "posix_fadvise"):
+        return
+
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 def convert_model_state_dict(
     state_dict: Dict[str, Any], key_map: Mapping[str, str]
 ) -> Dict[str, Any]:
@@ -91,14 +118,26 @@ def convert_model_state_dict(
     """
     new_state_dict = {}
 
+    # Compile the patterns once instead of looking them up in the regex cache
+    # of `re` for every key. Alongside each pattern we keep its literal prefix
+    # so that keys which cannot match are rejected by a cheap `startswith`
+    # check before the regex engine is involved.
+    patterns = [(_literal_prefix(p), re.compile(p), r) for p, r in key_map.items()]
+
     def get_new_key(old_key: str) -> str:
-        for old_pattern, replacement in key_map.items():
-            if (new_key := re.sub(old_pattern, replacement, old_key)) != old_key:
+        for prefix, old_pattern, replacement in patterns:
+            if not old_key.startswith(prefix):
+                continue
+
+            if (new_key := old_pattern.sub(replacement, old_key)) != old_key:
                 return new_key
 
         return old_key
 
-    # Convert module keys from fairseq to fairseq2.
+    # Convert module keys from fairseq to fairseq2. This is done serially on
+    # purpose; `re` holds the GIL while matching, and with the prefix check
+    # above the loop is dominated by cheap string operations that would not
+    # benefit from a thread pool.
     for old_key in state_dict.keys():
         new_key = get_new_key(old_key)
 
@@ -107,6 +146,79 @@ def convert_model_state_dict(
     return new_state_dict
 
 
+_GLOBAL_FLAGS_REGEX: Final = re.compile(r"\(\?[aiLmsux]+\)")
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Return the literal text that any match of the anchored ``pattern`` must
+    start with, or an empty string if it cannot be determined."""
+    if not pattern.startswith("^"):
+        return ""
+
+    # A top-level alternation means that the leading literal is not shared by
+    # all matches. Parentheses and bars inside character classes are literals,
+    # and global inline flags such as `(?i)` change how the literal is matched.
+    depth = 0
+
+    escaped = False
+
+    class_start = -1
+
+    for i, c in enumerate(pattern):
+        if escaped:
+            escaped = False
+        elif c == "\\":
+            escaped = True
+        elif class_start >= 0:
+            # A ']' right after '[' or '[^' is part of the class.
+            if c == "]" and i > class_start + 1:
+                if i != class_start + 2 or pattern[class_start + 1] != "^":
+                    class_start = -1
+        elif c == "[":
+            class_start = i
+        elif c == "(":
+            if _GLOBAL_FLAGS_REGEX.match(pattern, i):
+                return ""
+
+            depth += 1
+        elif c == ")":
+            depth -= 1
+        elif c == "|" and depth == 0:
+            return ""
+
+    # An unterminated character class is a malformed pattern; leave it to
+    # `re.compile()` to report.
+    if class_start >= 0:
+        return ""
+
+    prefix = []
+
+    i = 1
+
+    while i < len(pattern):
+        c = pattern[i]
+
+        if c == "\\" and i + 1 < len(pattern) and not pattern[i + 1].isalnum():
+            c = pattern[i + 1]
+
+            i += 2
+        elif c.isalnum() or c in "_-":
+            i += 1
+        else:
+            break
+
+        # An optional character is not part of the literal prefix.
+        if i < len(pattern) and pattern[i] in "?*{":
+            break
+
+        prefix.append(c)
+
+        if i < len(pattern) and pattern[i] == "+":
+            break
+
+    return "".join(prefix)
+
+
 def convert_fairseq_checkpoint(
     checkpoint: Dict[str, Any], key_map: Mapping[str, str]
 ) -> Dict[str, Any]:
@@ -121,7 +121,11 @@ def _do_gather(x: Tensor, gang: Gang, dim: int) -> Tensor:
     if gang.size == 1:
         return x
 
-    splits = [torch.empty_like(x) for _ in range(gang.size)]
+    # Allocate the splits as views of a single buffer so that the gang can
+    # gather into them with a single collective.
+    output = x.new_empty((gang.size,) + x.shape)
+
+    splits = list(output.unbind(0))
 
     gang.all_gather_to_list(splits, x)
 
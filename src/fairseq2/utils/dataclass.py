@@ -4,10 +4,11 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
-from dataclasses import asdict, is_dataclass
+from copy import deepcopy
+from dataclasses import asdict, fields, is_dataclass, replace
 from enum import Enum
 from pathlib import Path
-from typing import Any, List, MutableMapping
+from typing import Any, Dict, List, MutableMapping, TypeVar
 
 import yaml
 from typing_extensions import TypeGuard
@@ -15,6 +16,8 @@ from yaml.representer import RepresenterError
 
 from fairseq2.typing import DataClass
 
+DataClassT = TypeVar("DataClassT", bound=DataClass)
+
 
 def is_dataclass_instance(obj: Any) -> TypeGuard[DataClass]:
     """Return ``True`` if ``obj`` is of type :class:`DataClass`."""
@@ -87,6 +90,49 @@ def _maybe_convert(value: Any, kls: type) -> Any:
     return value
 
 
+def _copy_dataclass(obj: DataClassT) -> DataClassT:
+    """Return a deep copy of ``obj``.
+
+    Unlike :func:`copy.deepcopy`, immutable field values are shared with the
+    copy and nested dataclasses are copied field by field; only the remaining
+    mutable values are passed to :func:`copy.deepcopy`.
+    """
+    # `replace()` calls `__init__` again, which would run `__post_init__` on
+    # already processed values.
+    if hasattr(obj, "__post_init__"):
+        return deepcopy(obj)
+
+    obj_fields = fields(obj)
+
+    # `replace()` also requires every `InitVar` without a default to be
+    # specified. Unlike `__dataclass_fields__`, `fields()` skips `InitVar` and
+    # `ClassVar` pseudo-fields, so a size mismatch means there are some.
+    if len(obj_fields) != len(obj.__dataclass_fields__):
+        return deepcopy(obj)
+
+    changes: Dict[str, Any] = {}
+
+    for field in obj_fields:
+        # `replace()` cannot carry over fields that are not set via `__init__`.
+        if not field.init:
+            return deepcopy(obj)
+
+        value = getattr(obj, field.name)
+
+        if isinstance(value, _IMMUTABLE_TYPES):
+            continue
+
+        if is_dataclass_instance(value):
+            changes[field.name] = _copy_dataclass(value)
+        else:
+            changes[field.name] = deepcopy(value)
+
+    return replace(obj, **changes)
+
+
+_IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes, Enum)
+
+
 def _dump_dataclass(obj: DataClass, file: Path) -> None:
     fp = file.open("w")
 
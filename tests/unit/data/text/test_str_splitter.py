@@ -49,6 +49,20 @@ class TestStrSplitter:
 
         assert splitter("") == [""]
 
+    def test_call_works_when_input_is_a_list(self) -> None:
+        splitter = StrSplitter(sep=",")
+
+        assert splitter(["0,1", "", "2,,3"]) == [["0", "1"], [""], ["2", "", "3"]]
+
+    def test_call_works_when_input_is_a_list_and_names_are_specified(
+        self,
+    ) -> None:
+        splitter = StrSplitter(names=["a", "b"])
+
+        output = splitter(["1\t2", "3\t4"])
+
+        assert output == [{"a": "1", "b": "2"}, {"a": "3", "b": "4"}]
+
     def test_call_works_when_names_are_specified(self) -> None:
         s = "1\t2\t3"
 
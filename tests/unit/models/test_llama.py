@@ -0,0 +1,93 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+from typing import Any, Dict
+
+import pytest
+
+from fairseq2.models.llama import llama_archs
+from fairseq2.models.llama.setup import convert_llama_checkpoint
+
+
+class TestConvertLLaMACheckpointFunction:
+    def test_call_works(self) -> None:
+        checkpoint: Dict[str, Any] = {
+            "tok_embeddings.weight": 0,
+            "layers.0.attention.wq.weight": 1,
+            "layers.0.attention.wk.weight": 2,
+            "layers.0.attention.wv.weight": 3,
+            "layers.0.attention.wo.weight": 4,
+            "layers.0.attention_norm.weight": 5,
+            "layers.12.feed_forward.w1.weight": 6,
+            "layers.12.feed_forward.w2.weight": 7,
+            "layers.12.feed_forward.w3.weight": 8,
+            "layers.12.ffn_norm.weight": 9,
+            "norm.weight": 10,
+            "output.weight": 11,
+            "rope.freqs": 12,
+            "layers.0.attention.inner_attention.rope.freqs": 13,
+            "foo.weight": 14,
+            "layers.\u0663.ffn_norm.weight": 15,
+        }
+
+        checkpoint = convert_llama_checkpoint(checkpoint, llama_archs.get("7b"))
+
+        assert checkpoint == {
+            "model": {
+                "decoder_frontend.embed.weight": 0,
+                "decoder.layers.0.self_attn.q_proj.weight": 1,
+                "decoder.layers.0.self_attn.k_proj.weight": 2,
+                "decoder.layers.0.self_attn.v_proj.weight": 3,
+                "decoder.layers.0.self_attn.output_proj.weight": 4,
+                "decoder.layers.0.self_attn_layer_norm.weight": 5,
+                "decoder.layers.12.ffn.gate_proj.weight": 6,
+                "decoder.layers.12.ffn.output_proj.weight": 7,
+                "decoder.layers.12.ffn.inner_proj.weight": 8,
+                "decoder.layers.12.ffn_layer_norm.weight": 9,
+                "decoder.layer_norm.weight": 10,
+                "final_proj.weight": 11,
+                "foo.weight": 14,
+                "layers.\u0663.ffn_norm.weight": 15,
+            }
+        }
+
+    def test_call_modifies_checkpoint_in_place(self) -> None:
+        checkpoint: Dict[str, Any] = {
+            "layers.0.attention.wq.weight": 0,
+            "rope.freqs": 1,
+        }
+
+        converted_checkpoint = convert_llama_checkpoint(
+            checkpoint, llama_archs.get("7b")
+        )
+
+        assert converted_checkpoint["model"] is checkpoint
+
+        assert checkpoint == {"decoder.layers.0.self_attn.q_proj.weight": 0}
+
+    @pytest.mark.parametrize("arch_name", sorted(llama_archs.names()))
+    def test_call_works_for_all_archs(self, arch_name: str) -> None:
+        config = llama_archs.get(arch_name)
+
+        last_idx = config.num_layers - 1
+
+        checkpoint: Dict[str, Any] = {
+            "layers.0.attention.wq.weight": 0,
+            f"layers.{last_idx}.attention.wo.weight": 1,
+            f"layers.{last_idx}.feed_forward.w3.weight": 2,
+            f"layers.{config.num_layers}.ffn_norm.weight": 3,
+        }
+
+        checkpoint = convert_llama_checkpoint(checkpoint, config)
+
+        assert checkpoint == {
+            "model": {
+                "decoder.layers.0.self_attn.q_proj.weight": 0,
+                f"decoder.layers.{last_idx}.self_attn.output_proj.weight": 1,
+                f"decoder.layers.{last_idx}.ffn.inner_proj.weight": 2,
+                f"decoder.layers.{config.num_layers}.ffn_layer_norm.weight": 3,
+            }
+        }
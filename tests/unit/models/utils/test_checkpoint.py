@@ -0,0 +1,89 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import pytest
+
+from fairseq2.models.utils.checkpoint import _literal_prefix, convert_model_state_dict
+
+
+class TestConvertModelStateDictFunction:
+    def test_call_works(self) -> None:
+        key_map = {
+            # fmt: off
+            r"^encoder\.layers\.([0-9]+)\.fc1\.": r"encoder.layers.\1.ffn.inner_proj.",
+            r"^encoder\.layer_norm\.":            r"encoder.layer_norm.",
+            # fmt: on
+        }
+
+        state_dict = {
+            "encoder.layers.12.fc1.weight": 0,
+            "encoder.layer_norm.bias": 1,
+            "decoder.layers.0.fc1.weight": 2,
+        }
+
+        state_dict = convert_model_state_dict(state_dict, key_map)
+
+        assert state_dict == {
+            "encoder.layers.12.ffn.inner_proj.weight": 0,
+            "encoder.layer_norm.bias": 1,
+            "decoder.layers.0.fc1.weight": 2,
+        }
+
+    def test_call_applies_first_matching_pattern(self) -> None:
+        key_map = {
+            # fmt: off
+            r"^(foo|bar)\.": r"baz.",
+            r"^foo\.":       r"qux.",
+            r"^bar\.":       r"qux.",
+            r"^x\.":         r"y.",
+            r"^x\.y\.":      r"z.",
+            # fmt: on
+        }
+
+        state_dict = {"foo.a": 0, "bar.b": 1, "x.y.c": 2}
+
+        state_dict = convert_model_state_dict(state_dict, key_map)
+
+        assert state_dict == {"baz.a": 0, "baz.b": 1, "y.y.c": 2}
+
+    def test_call_works_when_alternation_follows_character_class(self) -> None:
+        key_map = {r"^a[(]|^b\.": r"c."}
+
+        state_dict = convert_model_state_dict({"b.x": 0, "d.x": 1}, key_map)
+
+        assert state_dict == {"c.x": 0, "d.x": 1}
+
+
+@pytest.mark.parametrize(
+    "pattern,expected_prefix",
+    [
+        (r"^encoder\.layers\.([0-9]+)\.fc1\.", "encoder.layers."),
+        (r"^foo_bar-baz", "foo_bar-baz"),
+        (r"^ab?c", "a"),
+        (r"^ab*c", "a"),
+        (r"^ab{2}c", "a"),
+        (r"^ab+c", "ab"),
+        (r"^a\.b", "a.b"),
+        (r"^a\d", "a"),
+        (r"^a.b", "a"),
+        (r"^x(a|b)", "x"),
+        (r"^(a|b)c", ""),
+        (r"^ab|c", ""),
+        (r"^a\|b", "a|b"),
+        (r"^a[(]|b", ""),
+        (r"^a[)]b", "a"),
+        (r"^a[]|]b", "a"),
+        (r"^a[^]|]b", "a"),
+        (r"^a[\]|]b", "a"),
+        (r"^a[]]|b", ""),
+        (r"^ab(?i)", ""),
+        (r"^ab(?i:c)", "ab"),
+        (r"abc", ""),
+        (r"^", ""),
+    ],
+)
+def test_literal_prefix_works(pattern: str, expected_prefix: str) -> None:
+    assert _literal_prefix(pattern) == expected_prefix
@@ -0,0 +1,82 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+from pathlib import Path
+from typing import Generator
+
+import pytest
+import torch
+import torch.distributed as dist
+
+from fairseq2.gang import FakeGang, ProcessGroupGang, ReduceOperation
+from fairseq2.typing import CPU
+from tests.common import assert_equal
+
+
+@pytest.fixture(scope="module")
+def gloo_gang(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[ProcessGroupGang, None, None]:
+    store_file: Path = tmp_path_factory.mktemp("gang") / "store"
+
+    dist.init_process_group(
+        "gloo", init_method=f"file://{store_file}", rank=0, world_size=1
+    )
+
+    try:
+        yield ProcessGroupGang.from_default_process_group()
+    finally:
+        dist.destroy_process_group()
+
+
+class TestFakeGang:
+    def test_create_gang_works(self) -> None:
+        gang = FakeGang(CPU)
+
+        assert gang.create_gang([0]) is gang
+
+    @pytest.mark.parametrize("rank", [-1, 1])
+    def test_create_gang_raises_error_when_rank_is_out_of_range(self, rank: int) -> None:
+        gang = FakeGang(CPU)
+
+        with pytest.raises(
+            ValueError,
+            match=rf"^The rank at index 0 in ``ranks`` must be greater than or equal to 0 and less than the size of the gang \(1\), but is {rank} instead\.$",
+        ):
+            gang.create_gang([rank])
+
+    def test_create_gang_raises_error_when_ranks_are_not_unique(self) -> None:
+        gang = FakeGang(CPU)
+
+        with pytest.raises(
+            ValueError, match=r"^The ranks in ``ranks`` must be all unique\.$"
+        ):
+            gang.create_gang([0, 0])
+
+
+class TestProcessGroupGang:
+    def test_all_reduce_coalesced_works(self, gloo_gang: ProcessGroupGang) -> None:
+        a = torch.tensor([1.0, 2.0], device=CPU, requires_grad=True)
+        b = torch.tensor([[3, 4], [5, 6]], device=CPU, dtype=torch.int64)
+        c = torch.tensor([7.0], device=CPU)
+
+        gloo_gang.all_reduce_coalesced([a, b, c], ReduceOperation.SUM)
+
+        # `a` and `c` share a bucket while `b` is reduced on its own.
+        assert_equal(a.detach(), [1.0, 2.0])
+        assert_equal(b, [[3, 4], [5, 6]])
+        assert_equal(c, [7.0])
+
+    def test_all_gather_to_list_works_when_outputs_share_buffer(
+        self, gloo_gang: ProcessGroupGang
+    ) -> None:
+        input_tensor = torch.tensor([1.0, 2.0], device=CPU)
+
+        output = torch.zeros((1, 2), device=CPU)
+
+        gloo_gang.all_gather_to_list(list(output.unbind(0)), input_tensor)
+
+        assert_equal(output, [[1.0, 2.0]])
@@ -4,12 +4,12 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import InitVar, dataclass, field
+from typing import List, Optional
 
 import pytest
 
-from fairseq2.utils.dataclass import update_dataclass
+from fairseq2.utils.dataclass import _copy_dataclass, update_dataclass
 
 
 @dataclass
@@ -70,3 +70,60 @@ class TestUpdateClassFunction:
             update_dataclass(obj, overrides)
 
         assert obj == Foo1(a=1, b="a", c=Foo2(x=2, y="foo4"), d=Foo2(x=3, y="foo3"))
+
+
+@dataclass
+class Foo3:
+    a: Foo2
+    b: List[int] = field(default_factory=list)
+
+
+class TestCopyDataclassFunction:
+    def test_call_works(self) -> None:
+        obj = Foo3(a=Foo2(x=2, y="foo3"), b=[1, 2])
+
+        obj_copy = _copy_dataclass(obj)
+
+        assert obj_copy == obj
+
+        assert obj_copy.a is not obj.a
+        assert obj_copy.b is not obj.b
+
+        obj_copy.a.x = 3
+
+        obj_copy.b.append(3)
+
+        assert obj == Foo3(a=Foo2(x=2, y="foo3"), b=[1, 2])
+
+    def test_call_works_when_dataclass_has_post_init(self) -> None:
+        obj = Foo4(a=[1])
+
+        obj_copy = _copy_dataclass(obj)
+
+        # `__post_init__` must not run again on the copy.
+        assert obj_copy.a == [1, 0]
+
+        assert obj_copy.a is not obj.a
+
+    def test_call_works_when_dataclass_has_init_var(self) -> None:
+        obj = Foo5(a=[1], b=2)
+
+        obj_copy = _copy_dataclass(obj)
+
+        assert obj_copy.a == [1]
+
+        assert obj_copy.a is not obj.a
+
+
+@dataclass
+class Foo4:
+    a: List[int]
+
+    def __post_init__(self) -> None:
+        self.a.append(0)
+
+
+@dataclass
+class Foo5:
+    a: List[int]
+    b: InitVar[int]